@@ -1,69 +1,46 @@
-try:
-    from polars.polars import (
-        CategoricalRemappingWarning,
-        ColumnNotFoundError,
-        ComputeError,
-        DuplicateError,
-        InvalidOperationError,
-        NoDataError,
-        OutOfBoundsError,
-        PolarsError,
-        PolarsPanicError,
-        PolarsWarning,
-        SchemaError,
-        SchemaFieldNotFoundError,
-        ShapeError,
-        StringCacheMismatchError,
-        StructFieldNotFoundError,
-    )
-except ImportError:
+from __future__ import annotations
+
+import sys
+from importlib.util import find_spec
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Callable
+
+_HAS_BINARY = find_spec("polars.polars") is not None
+
+if _HAS_BINARY:
+    try:
+        from polars.polars import (
+            CategoricalRemappingWarning,
+            ColumnNotFoundError,
+            ComputeError,
+            DuplicateError,
+            InvalidOperationError,
+            NoDataError,
+            OutOfBoundsError,
+            PolarsError,
+            PolarsPanicError,
+            PolarsWarning,
+            SchemaError,
+            SchemaFieldNotFoundError,
+            ShapeError,
+            StringCacheMismatchError,
+            StructFieldNotFoundError,
+        )
+    except ImportError:
+        # the binary exists but cannot be loaded (e.g. missing shared library)
+        _HAS_BINARY = False
+
+if not _HAS_BINARY:
     # redefined for documentation purposes when there is no binary
 
     class PolarsError(Exception):  # type: ignore[no-redef]
         """Base class for all Polars errors."""
 
-    class ColumnNotFoundError(PolarsError):  # type: ignore[no-redef, misc]
-        """Exception raised when a specified column is not found."""
-
-    class ComputeError(PolarsError):  # type: ignore[no-redef, misc]
-        """Exception raised when Polars could not perform an underlying computation."""
-
-    class DuplicateError(PolarsError):  # type: ignore[no-redef, misc]
-        """Exception raised when a column name is duplicated."""
-
-    class InvalidOperationError(PolarsError):  # type: ignore[no-redef, misc]
-        """Exception raised when an operation is not allowed (or possible) against a given object or data structure."""  # noqa: W505
-
-    class NoDataError(PolarsError):  # type: ignore[no-redef, misc]
-        """Exception raised when an operation cannot be performed on an empty data structure."""  # noqa: W505
-
-    class OutOfBoundsError(PolarsError):  # type: ignore[no-redef, misc]
-        """Exception raised when the given index is out of bounds."""
-
-    class PolarsPanicError(PolarsError):  # type: ignore[no-redef, misc]
-        """Exception raised when an unexpected state causes a panic in the underlying Rust library."""  # noqa: W505
-
-    class SchemaError(PolarsError):  # type: ignore[no-redef, misc]
-        """Exception raised when an unexpected schema mismatch causes an error."""
-
-    class SchemaFieldNotFoundError(PolarsError):  # type: ignore[no-redef, misc]
-        """Exception raised when a specified schema field is not found."""
-
-    class ShapeError(PolarsError):  # type: ignore[no-redef, misc]
-        """Exception raised when trying to perform operations on data structures with incompatible shapes."""  # noqa: W505
-
-    class StringCacheMismatchError(PolarsError):  # type: ignore[no-redef, misc]
-        """Exception raised when string caches come from different sources."""
-
-    class StructFieldNotFoundError(PolarsError):  # type: ignore[no-redef, misc]
-        """Exception raised when a specified Struct field is not found."""
-
     class PolarsWarning(Exception):  # type: ignore[no-redef]
         """Base class for all Polars warnings."""
 
-    class CategoricalRemappingWarning(PolarsWarning):  # type: ignore[no-redef, misc]
-        """Warning raised when a categorical needs to be remapped to be compatible with another categorical."""  # noqa: W505
-
 
 class InvalidAssert(PolarsError):  # type: ignore[misc]
     """Exception raised when an unsupported testing assert is made."""
@@ -125,7 +102,67 @@ class CustomUFuncWarning(PolarsWarning):  # type: ignore[misc]
     """Warning issued when a custom ufunc is handled differently than numpy ufunc would."""  # noqa: W505
 
 
-__all__ = [
+if not _HAS_BINARY:
+    # the remaining classes of the binary are stood in for by documentation-only
+    # stubs, built on first access; none of this is needed when the binary exists
+    from functools import lru_cache, partial
+
+    _STUB_DOCS: dict[str, str] = {
+        "ColumnNotFoundError": "Exception raised when a specified column is not found.",
+        "ComputeError": "Exception raised when Polars could not perform an underlying computation.",
+        "DuplicateError": "Exception raised when a column name is duplicated.",
+        "InvalidOperationError": "Exception raised when an operation is not allowed (or possible) against a given object or data structure.",
+        "NoDataError": "Exception raised when an operation cannot be performed on an empty data structure.",
+        "OutOfBoundsError": "Exception raised when the given index is out of bounds.",
+        "PolarsPanicError": "Exception raised when an unexpected state causes a panic in the underlying Rust library.",
+        "SchemaError": "Exception raised when an unexpected schema mismatch causes an error.",
+        "SchemaFieldNotFoundError": "Exception raised when a specified schema field is not found.",
+        "ShapeError": "Exception raised when trying to perform operations on data structures with incompatible shapes.",
+        "StringCacheMismatchError": "Exception raised when string caches come from different sources.",
+        "StructFieldNotFoundError": "Exception raised when a specified Struct field is not found.",
+    }
+    _STUB_WARNING_DOCS: dict[str, str] = {
+        "CategoricalRemappingWarning": "Warning raised when a categorical needs to be remapped to be compatible with another categorical.",
+    }
+
+    # docstrings passed to `type()` are ordinary string constants, so drop them
+    # ourselves under `-OO` (as the interpreter would for `class` statements)
+    _KEEP_DOCS = sys.flags.optimize < 2
+
+    @lru_cache(maxsize=None)
+    def _make_class(name: str, base: type, doc: str) -> type:
+        """Build a documentation-only stand-in for an error class of the binary."""
+        # no per-class attributes; don't add anything beyond what the base provides
+        namespace: dict[str, object] = {"__module__": __name__, "__slots__": ()}
+        if _KEEP_DOCS:
+            namespace["__doc__"] = doc
+        return type(name, (base,), namespace)
+
+    _LAZY: dict[str, Callable[[], type]] = {}
+    for _name, _doc in _STUB_DOCS.items():
+        _LAZY[_name] = partial(_make_class, _name, PolarsError, _doc)
+    for _name, _doc in _STUB_WARNING_DOCS.items():
+        _LAZY[_name] = partial(_make_class, _name, PolarsWarning, _doc)
+    del _name, _doc
+
+    # hidden from type checkers, which see every class through the imports above
+    if not TYPE_CHECKING:
+
+        def __getattr__(name: str) -> type:
+            factory = _LAZY.get(name)
+            if factory is None:
+                msg = f"module {__name__!r} has no attribute {name!r}"
+                raise AttributeError(msg)
+            # install into the module namespace so later lookups bypass `__getattr__`;
+            # `setdefault` ensures that concurrent first accesses (e.g. under
+            # free-threading) all resolve to the same class object
+            return globals().setdefault(name, factory())
+
+        def __dir__() -> list[str]:
+            return sorted({*_LAZY, *globals()})
+
+
+__all__ = (
     "ArrowError",
     "ColumnNotFoundError",
     "ComputeError",
@@ -148,4 +185,4 @@ __all__ = [
     "StringCacheMismatchError",
     "StructFieldNotFoundError",
     "TooManyRowsReturnedError",
-]
+)